@@ -1,6 +1,6 @@
 // ============ Imports ============
 
-import { storage } from './client';
+import { fetchStaticData, storage } from './client';
 
 // ============ Types ============
 
@@ -95,14 +95,15 @@ export async function getAnalyticsSummary(): Promise<AnalyticsSummaryResponse> {
   const questionProgress = storage.get<Record<number, { is_correct: boolean; attempt_count?: number }>>(QUESTION_PROGRESS_KEY) || {};
 
   // Load static data for domain mapping
-  const flashcardsRes = await fetch('/data/flashcards.json');
-  const flashcards: { id: number; domain_id: number }[] = await flashcardsRes.json();
+  const [flashcards, questions, domains] = await Promise.all([
+    fetchStaticData<{ id: number; domain_id: number }[]>('/data/flashcards.json'),
+    fetchStaticData<{ id: number; domain_id: number; task_id: number }[]>('/data/questions.json'),
+    fetchStaticData<{ id: number; name: string; weight: number }[]>('/data/domains.json'),
+  ]);
 
-  const questionsRes = await fetch('/data/questions.json');
-  const questions: { id: number; domain_id: number; task_id: number }[] = await questionsRes.json();
-
-  const domainsRes = await fetch('/data/domains.json');
-  const domains: { id: number; name: string; weight: number }[] = await domainsRes.json();
+  // Index static rows by id so each progress entry resolves in O(1)
+  const questionsById = new Map(questions.map(q => [q.id, q] as const));
+  const flashcardsById = new Map(flashcards.map(c => [c.id, c] as const));
 
   // Calculate domain performance
   const domainStats: Record<number, { correct: number; total: number; flashcardCount: number }> = {};
@@ -115,7 +116,7 @@ export async function getAnalyticsSummary(): Promise<AnalyticsSummaryResponse> {
   // Calculate question accuracy by domain
   Object.entries(questionProgress).forEach(([qIdStr, progress]) => {
     const qId = parseInt(qIdStr);
-    const question = questions.find(q => q.id === qId);
+    const question = questionsById.get(qId);
     if (question) {
       domainStats[question.domain_id].total += 1;
       if (progress.is_correct) {
@@ -125,17 +126,12 @@ export async function getAnalyticsSummary(): Promise<AnalyticsSummaryResponse> {
   });
 
   // Count flashcards with good progress (ease_factor >= 2.5, repetitions >= 2)
-  Object.values(flashcardProgress).forEach((fp) => {
+  Object.entries(flashcardProgress).forEach(([cardIdStr, fp]) => {
     if (fp.ease_factor >= 2.5 && fp.repetitions >= 2) {
       // Find which domain this flashcard belongs to
-      const cardId = Object.keys(flashcardProgress).find(
-        key => flashcardProgress[parseInt(key)] === fp
-      );
-      if (cardId) {
-        const card = flashcards.find(c => c.id === parseInt(cardId));
-        if (card) {
-          domainStats[card.domain_id].flashcardCount += 1;
-        }
+      const card = flashcardsById.get(parseInt(cardIdStr));
+      if (card) {
+        domainStats[card.domain_id].flashcardCount += 1;
       }
     }
   });
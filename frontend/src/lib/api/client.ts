@@ -44,6 +44,23 @@ export const storage = {
   },
 };
 
+/**
+ * Static Data Cache - bundled JSON never changes at runtime, so each file is
+ * fetched and parsed at most once per page load and shared by all callers
+ */
+const staticDataCache = new Map<string, Promise<unknown>>();
+
+export function fetchStaticData<T>(path: string): Promise<T> {
+  let cached = staticDataCache.get(path);
+  if (!cached) {
+    cached = fetch(path).then((res) => res.json());
+    // Forget failed loads so the next caller retries
+    cached.catch(() => staticDataCache.delete(path));
+    staticDataCache.set(path, cached);
+  }
+  return cached as Promise<T>;
+}
+
 /**
  * Simulated API Error
  */
@@ -65,8 +82,7 @@ export class ApiClientError extends Error {
 export async function fetcher<T>(url: string): Promise<T> {
   // Handle static data requests
   if (url.startsWith('/api/domains')) {
-    const res = await fetch('/data/domains.json');
-    const data: { id: number }[] = await res.json();
+    const data = await fetchStaticData<{ id: number }[]>('/data/domains.json');
     
     const domainIdMatch = url.match(/\/api\/domains\/(\d+)/);
     if (domainIdMatch) {
@@ -79,8 +95,7 @@ export async function fetcher<T>(url: string): Promise<T> {
   }
   
   if (url.startsWith('/api/tasks')) {
-    const res = await fetch('/data/tasks.json');
-    const allTasks: { id: number; domain_id: number }[] = await res.json();
+    const allTasks = await fetchStaticData<{ id: number; domain_id: number }[]>('/data/tasks.json');
     const taskIdMatch = url.match(/\/api\/tasks\/(\d+)/);
     if (taskIdMatch) {
       const id = parseInt(taskIdMatch[1]);
@@ -101,8 +116,7 @@ export async function fetcher<T>(url: string): Promise<T> {
   }
   
   if (url.startsWith('/api/flashcards')) {
-    const res = await fetch('/data/flashcards.json');
-    const allCards: { id: number; domain_id: number; task_id: number }[] = await res.json();
+    const allCards = await fetchStaticData<{ id: number; domain_id: number; task_id: number }[]>('/data/flashcards.json');
     
     const singleMatch = url.match(/\/api\/flashcards\/(\d+)/);
     if (singleMatch) {
@@ -125,8 +139,7 @@ export async function fetcher<T>(url: string): Promise<T> {
   }
   
   if (url.startsWith('/api/questions')) {
-    const res = await fetch('/data/questions.json');
-    const allQuestions: { id: number; domain_id: number; task_id: number }[] = await res.json();
+    const allQuestions = await fetchStaticData<{ id: number; domain_id: number; task_id: number }[]>('/data/questions.json');
     
     const singleMatch = url.match(/\/api\/questions\/(\d+)/);
     if (singleMatch) {
@@ -4,7 +4,7 @@
  * Uses X-Anonymous-ID header for anonymous user tracking
  */
 
-import { storage } from './client';
+import { fetchStaticData, storage } from './client';
 import type {
   ExamSession,
   ExamSessionDetail,
@@ -141,11 +141,10 @@ export async function getExamSession(_sessionId: string): Promise<ExamSessionWit
 }
 
 export async function getExamSessionQuestions(_sessionId: string): Promise<ExamQuestionsList> {
-  const res = await fetch('/data/questions.json');
-  const allQuestions = await res.json();
-  
+  const allQuestions = await fetchStaticData<{ id: number; question_text: string; option_a: string; option_b: string; option_c: string; option_d: string }[]>('/data/questions.json');
+
   // Map raw questions to ExamQuestion type
-  const examQuestions: ExamQuestion[] = allQuestions.slice(0, 185).map((q: { id: number; question_text: string; option_a: string; option_b: string; option_c: string; option_d: string }, index: number) => ({
+  const examQuestions: ExamQuestion[] = allQuestions.slice(0, 185).map((q, index) => ({
     question_index: index,
     question_id: q.id,
     question_text: q.question_text,
@@ -168,9 +167,12 @@ export async function getExamSessionQuestions(_sessionId: string): Promise<ExamQ
 }
 
 export async function resumeExamSession(_sessionId: string): Promise<ExamResumeData> {
-  const session = await getExamSession(_sessionId);
-  const questions = await getExamSessionQuestions(_sessionId);
-  
+  // Load the session and its questions together rather than back to back
+  const [session, questions] = await Promise.all([
+    getExamSession(_sessionId),
+    getExamSessionQuestions(_sessionId),
+  ]);
+
   return {
     session: {
       ...session,
@@ -188,11 +190,22 @@ export async function getExamHistory(options?: {
   limit?: number;
   offset?: number;
 }): Promise<ExamSession[]> {
-  let sessions = storage.get<ExamSession[]>(EXAM_SESSIONS_KEY) || [];
-  if (options?.status) {
-    sessions = sessions.filter(s => s.status === options.status);
+  const sessions = storage.get<ExamSession[]>(EXAM_SESSIONS_KEY) || [];
+  const limit = options?.limit || 10;
+  let skip = options?.offset || 0;
+
+  // Sessions are appended at creation, so walking backwards yields newest
+  // first and lets us stop as soon as the page is full
+  const page: ExamSession[] = [];
+  for (let i = sessions.length - 1; i >= 0 && page.length < limit; i--) {
+    if (options?.status && sessions[i].status !== options.status) continue;
+    if (skip > 0) {
+      skip--;
+      continue;
+    }
+    page.push(sessions[i]);
   }
-  return sessions.slice(0, options?.limit || 10);
+  return page;
 }
 
 export async function abandonExamSession(_sessionId: string): Promise<void> {
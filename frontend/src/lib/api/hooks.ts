@@ -4,7 +4,7 @@
 
 import useSWR, { mutate } from 'swr';
 import useSWRMutation from 'swr/mutation';
-import { fetcher, post, storage } from './client';
+import { fetchStaticData, fetcher, post, storage } from './client';
 import { calculateSM2, isCardDue, type SM2Progress } from '../utils/sm2';
 import type {
   DomainWithTasks,
@@ -67,9 +67,9 @@ interface FlashcardFilters {
  * Custom fetcher that attaches SM-2 progress to flashcards
  */
 async function fetcherWithSM2Progress(url: string): Promise<FlashcardWithProgress[]> {
-  // Fetch base flashcards from static JSON
-  const res = await fetch(url.startsWith('/api') ? url.replace('/api/flashcards', '/data/flashcards.json') : url);
-  const flashcards: FlashcardWithProgress[] = await res.json();
+  // Fetch base flashcards from static JSON (query params never reached the static file)
+  const path = url.startsWith('/api') ? '/data/flashcards.json' : url;
+  const flashcards = await fetchStaticData<FlashcardWithProgress[]>(path);
 
   // Load SM-2 progress from localStorage
   const sm2Progress = storage.get<Record<number, SM2Progress>>(SM2_PROGRESS_KEY) || {};
@@ -105,9 +105,10 @@ export function useFlashcards(filters?: FlashcardFilters) {
   // Filter by due_only if requested
   let filteredData = data;
   if (filters?.due_only && data) {
+    const now = Date.now();
     filteredData = data.filter(card => {
       if (!card.progress) return true; // No progress means due
-      return isCardDue(card.progress.next_review_date);
+      return isCardDue(card.progress.next_review_date, now);
     });
   }
 
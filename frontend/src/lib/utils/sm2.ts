@@ -88,9 +88,10 @@ export function calculateSM2(
 
 /**
  * Check if a flashcard is due for review
+ * Pass `now` when checking many cards so the clock is read once
  */
-export function isCardDue(nextReviewDate: string): boolean {
-  return new Date(nextReviewDate) <= new Date();
+export function isCardDue(nextReviewDate: string, now: number = Date.now()): boolean {
+  return Date.parse(nextReviewDate) <= now;
 }
 
 /**
@@ -99,9 +100,10 @@ export function isCardDue(nextReviewDate: string): boolean {
 export function getDueCards(
   cards: Array<{ id: number; progress?: SM2Progress }>
 ): Array<{ id: number; progress?: SM2Progress }> {
+  const now = Date.now();
   return cards.filter(
     (card) =>
-      !card.progress?.next_review_date || isCardDue(card.progress.next_review_date)
+      !card.progress?.next_review_date || isCardDue(card.progress.next_review_date, now)
   );
 }
 